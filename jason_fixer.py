@@ -1,27 +1,358 @@
 import json
-from typing import Any, Dict, List, Union, Optional
+import math
+import re
+import sys
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union, Optional
 import os
+import mmap
+import atexit
+import threading
 from multiprocessing import Pool, cpu_count
 from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
+
+
+if orjson is not None:
+    # orjson decodes integers beyond 64 bits as floats of magnitude 2**63 or more instead of
+    # raising. Such integers take 19+ digits in a row, which one bytes.translate and a
+    # substring search rule out far cheaper than walking the parsed value.
+    _DIGIT_TABLE = bytes.maketrans(b'0123456789', b'0' * 10)
+    _LONG_DIGIT_RUN = b'0' * 19
+    _INT64_LIMIT = float(2 ** 63)
+
+    def _has_big_float(obj: Any) -> bool:
+        """True if obj holds a float outside the 64-bit integer range anywhere inside it"""
+        stack = [obj]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            value = pop()
+            kind = type(value)
+            if kind is float:
+                if not -_INT64_LIMIT < value < _INT64_LIMIT:
+                    return True
+            elif kind is dict:
+                extend(value.values())
+            elif kind is list:
+                extend(value)
+        return False
+
+    def _loads(text: str) -> Any:
+        """orjson.loads, redone with json.loads when it had to turn an integer into a float"""
+        parsed = orjson.loads(text)
+        if (_LONG_DIGIT_RUN in text.encode().translate(_DIGIT_TABLE)
+                and _has_big_float(parsed)):
+            return json.loads(text)
+        return parsed
+
+    def _has_non_finite(obj: Any) -> bool:
+        """True if obj holds a NaN or infinite float anywhere inside it"""
+        stack = [obj]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, float):
+                if not math.isfinite(value):
+                    return True
+            elif isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, list):
+                stack.extend(value)
+        return False
+
+    def _dumps(obj: Any) -> str:
+        """
+        Compact JSON encoding, falling back to json for values orjson rejects (e.g. big ints)
+        and for NaN/Infinity, which orjson would write as null
+        """
+        try:
+            encoded = orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+        # Non-finite floats only come from json.loads or the repair parser, and always show
+        # up as null, so the walk only runs when there is one to find
+        if 'null' in encoded and _has_non_finite(obj):
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+        return encoded
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        """Compact JSON encoding, non-ASCII written as UTF-8 like orjson does"""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+# Code points compared by the structure scan
+_DQUOTE, _SQUOTE = ord('"'), ord("'")
+_LBRACE, _RBRACE = ord('{'), ord('}')
+_LBRACKET, _RBRACKET = ord('['), ord(']')
+_COLON, _COMMA = ord(':'), ord(',')
+
+
+_WS_DEL_TABLE = str.maketrans('', '', ' \t\n\r')
+# Tokens re-encoding may spell differently: floats (1.50, 1e5), -0 and the non-finite
+# constants. Matches inside strings too, which only costs a re-serialization.
+_REWRITTEN_RE = re.compile(r'\d[.eE]|-0\b|NaN|Infinity')
+
+
+def _key_count(obj: Any) -> int:
+    """Number of keys across every object inside a parsed value"""
+    count = 0
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        value = pop()
+        kind = type(value)
+        if kind is dict:
+            count += len(value)
+            extend(value.values())
+        elif kind is list:
+            extend(value)
+    return count
+
+
+def _is_compact(text: str, parsed: Any) -> bool:
+    """
+    True if valid JSON text is already in standard form: no JSON whitespace, no escapes
+    (e.g. \\u00e9) that re-encoding would write out as plain UTF-8, no numbers or
+    constants it would write differently, and no duplicate keys it would drop
+    """
+    if ('\\' in text or len(text.translate(_WS_DEL_TABLE)) != len(text)
+            or _REWRITTEN_RE.search(text) is not None):
+        return False
+    # Without backslashes every quote delimits a string, so each '":' ends exactly one key.
+    # Parsing keeps one entry per distinct key, so fewer keys parsed means duplicates.
+    written = text.count('":')
+    return written == 0 or written == _key_count(parsed)
+
+
+_WHITESPACE = frozenset(' \t\n\r')
+
+# Special values in their common spellings, so lookups only lowercase unusual ones
+_KEYWORDS = {
+    'true': True, 'false': False, 'null': None,
+    'TRUE': True, 'FALSE': False, 'NULL': None,
+    'True': True, 'False': False, 'Null': None,
+}
+_NUMBER_PREFIX = frozenset('+-.0123456789')  # Tokens starting with anything else are not numbers
+
+# Runs the parser skips in one C-level regex call instead of stepping char by char
+_WS_RE = re.compile(r'\s*')
+_WS_COMMA_RE = re.compile(r'[\s,]*')
+_NUMBER_RE = re.compile(r'[\d.\-]*(?:[eE][-+]?\d*)?')  # A sign only right after the exponent marker
+_UNQUOTED_RUN_RE = re.compile(r'[^,:\]}\s\\]*')
+_QUOTED_RUN_RE = {
+    '"': re.compile(r'[^"\\]*'),
+    "'": re.compile(r"[^'\\]*"),
+}
+
+# Whole well-formed tokens in one match. Numbers and bare words only match when the slow
+# path would stop at the same place, so both always agree on where a token ends.
+_DQ_STRING = r'"([^"\\]*(?:\\.[^"\\]*)*)"'
+_DQ_STRING_RE = re.compile(_DQ_STRING, re.DOTALL)
+_TOKEN_RE = re.compile(r'''
+    \s*(?:
+        ([{\[])                                             # 1: object or array start
+      | ''' + _DQ_STRING + r'''                       # 2: double-quoted string
+      | (-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)(?![\d.\-+eE])   # 3: number
+      | ([A-Za-z][A-Za-z0-9_]*)(?=[,:\]}\s]|\Z)           # 4: bare word
+    )''', re.VERBOSE | re.DOTALL)
+_TOKEN_OPEN, _TOKEN_STRING, _TOKEN_NUMBER, _TOKEN_WORD = 1, 2, 3, 4
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+
+def _scan_structure(buf, stack, err_chars, err_pos) -> int:
+    """
+    Walk the code points in buf tracking quote and bracket nesting.
+
+    Mismatched quotes, unexpected or mismatched brackets, misplaced colons and anything
+    left open at the end are written to err_chars/err_pos in the order they are found.
+
+    Args:
+        buf: Sequence of code points (one per character of the text).
+        stack: Scratch buffer of at least len(buf) ints for opening bracket positions, or a
+            _GrowingBuffer.
+        err_chars: Output buffer of at least 4 * len(buf) + 2 ints for error code points, or a
+            _GrowingBuffer.
+        err_pos: Output buffer of the same size for error positions.
+
+    Returns:
+        int: The number of errors written.
+    """
+    n = len(buf)
+    count = 0
+    quote = 0  # Open quote code point, 0 outside of a string
+    quote_pos = 0
+    top = 0
+    key_mode = True  # True when expecting a key in an object
+
+    for i in range(n):
+        c = buf[i]
+        # Quote handling
+        if c == _DQUOTE or c == _SQUOTE:
+            if quote == 0:
+                quote = c
+                quote_pos = i
+            elif c == quote:
+                quote = 0
+            else:
+                err_chars[count] = c
+                err_pos[count] = i
+                err_chars[count + 1] = quote
+                err_pos[count + 1] = quote_pos
+                count += 2
+            continue
+
+        if quote != 0:
+            continue
+
+        if c == _LBRACKET or c == _LBRACE:
+            stack[top] = i
+            top += 1
+            if c == _LBRACE:
+                key_mode = True
+        elif c == _RBRACKET or c == _RBRACE:
+            if top == 0:
+                err_chars[count] = c
+                err_pos[count] = i
+                count += 1
+            else:
+                top -= 1
+                open_pos = stack[top]
+                open_char = buf[open_pos]
+                expected = _RBRACKET if open_char == _LBRACKET else _RBRACE
+                if c != expected:
+                    err_chars[count] = c
+                    err_pos[count] = i
+                    err_chars[count + 1] = open_char
+                    err_pos[count + 1] = open_pos
+                    count += 2
+        elif c == _COLON:
+            if not key_mode:
+                err_chars[count] = c
+                err_pos[count] = i
+                count += 1
+            key_mode = False
+        elif c == _COMMA:
+            key_mode = True
+
+    if quote != 0:
+        err_chars[count] = quote
+        err_pos[count] = quote_pos
+        err_chars[count + 1] = quote
+        err_pos[count + 1] = n
+        count += 2
+
+    for k in range(top):
+        open_pos = stack[k]
+        open_char = buf[open_pos]
+        err_chars[count] = open_char
+        err_pos[count] = open_pos
+        err_chars[count + 1] = _RBRACKET if open_char == _LBRACKET else _RBRACE
+        err_pos[count + 1] = n
+        count += 2
+
+    return count
+
+
+class _GrowingBuffer(array):
+    """
+    array('q') that grows when written one past its end.
+
+    _scan_structure only ever writes at or one past the last slot, so the pure-Python
+    scan holds what it finds instead of a worst-case preallocation.
+    """
+
+    def __new__(cls):
+        return super().__new__(cls, 'q')
+
+    def __setitem__(self, index, value):
+        if index == len(self):
+            self.append(value)
+        else:
+            super().__setitem__(index, value)
+
+
+# Importing numba and compiling the scan takes about as long as the plain Python scan
+# needs for 1-2 MB of text, so smaller inputs never load numba
+_JIT_SCAN_THRESHOLD = 1 << 20  # Chars
+_COMPILED_SCAN = None  # (kernel, numpy) once compiled, False if numba isn't installed
+_COMPILE_LOCK = threading.Lock()
+
+
+def _compiled_scan() -> Optional[tuple]:
+    """
+    _scan_structure compiled with numba, imported and compiled on first use.
+
+    Returns:
+        Optional[tuple]: (kernel, numpy module), or None when numba isn't installed.
+    """
+    global _COMPILED_SCAN
+    with _COMPILE_LOCK:
+        if _COMPILED_SCAN is None:
+            try:
+                from numba import njit
+                import numpy
+            except ImportError:  # numba is optional, the structure scan then runs as plain Python
+                _COMPILED_SCAN = False
+            else:
+                _COMPILED_SCAN = (njit(cache=True)(_scan_structure), numpy)
+        return _COMPILED_SCAN or None
+
+
+def _scan_errors(text: str) -> List[tuple]:
+    """Run _scan_structure over text and return the errors as (char, position) pairs"""
+    raw = text.encode('utf-32-le', 'surrogatepass')
+    compiled = _compiled_scan() if len(text) >= _JIT_SCAN_THRESHOLD else None
+    if compiled is not None:
+        kernel, np = compiled
+        size = 4 * len(text) + 2
+        buf = np.frombuffer(raw, dtype=np.uint32)
+        stack = np.empty(len(text), dtype=np.int64)
+        err_chars = np.empty(size, dtype=np.int64)
+        err_pos = np.empty(size, dtype=np.int64)
+    else:
+        kernel = _scan_structure
+        buf = memoryview(raw).cast('I')
+        stack = _GrowingBuffer()
+        err_chars = _GrowingBuffer()
+        err_pos = _GrowingBuffer()
+    count = kernel(buf, stack, err_chars, err_pos)
+    return [(chr(err_chars[k]), int(err_pos[k])) for k in range(count)]
+
 
 class JsonResults:
     def __init__(self, original: str, fixed: str):
         self.original = original
         self.fixed = fixed
-        self.errors: Dict[str, List[int]] = {}  # {char: [positions]}
+        # Errors as two parallel columns in the order they were found: char i was at position i
+        self._err_chars: List[str] = []
+        self._err_pos = array('q')
         
     def add_error(self, char: str, index: int):
-        if char not in self.errors:
-            self.errors[char] = []
-        self.errors[char].append(index)
+        self._err_chars.append(char)
+        self._err_pos.append(index)
 
     def __str__(self) -> str:
         return self.fixed
+
+    @property
+    def errors(self) -> Dict[str, List[int]]:
+        """{char: [positions]}, built on access"""
+        return self.get_errors()
         
     def get_errors(self) -> Dict[str, List[int]]:
-        return self.errors.copy()
+        errors: Dict[str, List[int]] = {}
+        for char, pos in zip(self._err_chars, self._err_pos):
+            if char in errors:
+                errors[char].append(pos)
+            else:
+                errors[char] = [pos]
+        return errors
     
     def to_dict(self) -> Dict:
         try:
@@ -30,18 +361,129 @@ class JsonResults:
             return {}
 
 
-def _process_json_chunk(chunk: str) -> Dict:
-    """Standalone function for processing JSON chunks"""
-    try:
-        return json.loads(chunk)
-    except json.JSONDecodeError:
-        return {}
-
 def _parallel_process(json_str: str) -> JsonResults:
     """Standalone function for parallel processing"""
     fixer = JsonFixer()
     return fixer.load_json(json_str)
 
+_POOL = None  # Process pool shared by every caller, see _get_pool
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool(workers: int):
+    """
+    Return the shared process pool, creating it on first use.
+
+    A pool with at least this many workers is reused. A smaller one is closed and joined
+    before it is replaced, so there is never more than one set of worker processes.
+    """
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_WORKERS < workers:
+            _close_pool()
+            _POOL = Pool(processes=workers)
+            _POOL_WORKERS = workers
+        return _POOL
+
+
+def _close_pool():
+    """Shut the shared pool down, waiting for work already queued on it"""
+    global _POOL, _POOL_WORKERS
+    if _POOL is not None:
+        _POOL.close()
+        _POOL.join()
+        _POOL = None
+        _POOL_WORKERS = 0
+
+
+atexit.register(_close_pool)
+
+
+def _pool_map(func, items: List, workers: int) -> List:
+    """Map func over items on the shared pool, batching items to amortize IPC, keeping input order"""
+    chunksize = max(1, len(items) // (workers * 4))
+    return list(_get_pool(workers).imap(func, items, chunksize=chunksize))
+
+_MISSING = object()  # Marks a schema key that isn't in the document
+_DECODER = json.JSONDecoder()
+
+
+# A quoted string or a bracket, the tokens that decide nesting depth
+_SQ_STRING = r"'[^'\\]*(?:\\.[^'\\]*)*'"
+_STRUCTURE_RE = re.compile(_DQ_STRING + '|' + _SQ_STRING + r'|[{}\[\]]', re.DOTALL)
+
+
+class _SchemaSource:
+    """
+    Values of the top-level keys of a malformed document, decoded on demand.
+
+    Key positions are collected in one pass that tracks bracket depth, so a key inside a
+    nested object never shadows the top-level one, and brackets inside single- or
+    double-quoted strings don't count. A repeated key keeps its last value, like json.loads.
+    The tolerant parser is only built when a value fails to decode, and then once per document.
+    """
+
+    def __init__(self, s: str):
+        self.s = s
+        self.positions = {}  # Encoded key -> index of its value
+        self._fixer = None
+        depth = 0
+        for m in _STRUCTURE_RE.finditer(s):
+            token = m.group()
+            first = token[0]
+            if first == '"' or first == "'":
+                if depth == 1:
+                    i = _WS_RE.match(s, m.end()).end()
+                    if s.startswith(':', i):
+                        if first == "'":
+                            # 'key' is looked up like "key"
+                            key = _ESCAPE_RE.sub(r'\1', token[1:-1])
+                            token = json.dumps(key, ensure_ascii=False)
+                        self.positions[token] = _WS_RE.match(s, i + 1).end()
+            elif token in '{[':
+                depth += 1
+            else:
+                depth -= 1
+
+    def get(self, needle: str) -> Any:
+        """
+        Value of an encoded key, or _MISSING if the document has no such top-level key.
+        """
+        i = self.positions.get(needle)
+        if i is None:
+            return _MISSING
+        try:
+            return _DECODER.raw_decode(self.s, i)[0]
+        except json.JSONDecodeError:
+            if self._fixer is None:
+                self._fixer = JsonFixer()
+                self._fixer.json_str = self.s
+            self._fixer.index = i
+            return self._fixer.parse()
+
+@lru_cache(maxsize=8192)
+def _intern(key: str) -> str:
+    """Interned copy of an object key, bounded so one-off keys don't pile up"""
+    return sys.intern(key)
+
+@lru_cache(maxsize=4096)
+def _parse_cached(json_str: str) -> tuple:
+    """
+    Cached tolerant parse for repeated JSON patterns.
+
+    Runs on a throwaway fixer so the function stays pure; errors found while parsing
+    are returned alongside the value for the caller to track.
+
+    Returns:
+        tuple: (parsed value, tuple of (char, position) errors)
+    """
+    fixer = JsonFixer()
+    fixer.json_str = json_str
+    fixer.result = JsonResults(json_str, json_str)
+    parsed = fixer.parse()
+    return parsed, tuple(zip(fixer.result._err_chars, fixer.result._err_pos))
+
 class JsonFixer:
     """
     A utility class for parsing and fixing malformed JSON strings.
@@ -62,91 +504,158 @@ class JsonFixer:
         parse_string(): Parse a JSON string value
         parse_number(): Parse a JSON number value
         load_json(text): Load and fix a potentially malformed JSON string
+        iter_ndjson(text): Lazily load and fix newline-delimited JSON, one result per line
+        compile_schema(keys): Build a fast parser for documents with a known set of keys
         from_file(filename): Load and fix JSON from a file
         >>> fixer = JsonFixer(logging=True)
         >>> result = fixer.load_json('{"key": "value",}')  # Malformed JSON
         {"key":"value"}
     """
     STRING_DELIMITERS = ['"', "'", """, """]
+    _DELIMITER_SET = frozenset(STRING_DELIMITERS)
 
     def __init__(self, logging: bool = False, max_workers: Optional[int] = None):
         self.index = 0
         self.json_str = ""
         self.logging = logging
-        self.logger = [] if logging else None
+        self._logger = [] if logging else None
+        self._pending_logs = []  # (char, pos, context) not yet formatted into self._logger
         self.result = None
         self.max_workers = max_workers or max(1, cpu_count() - 1)
+
+    @property
+    def logger(self) -> Optional[List[Dict]]:
+        """Logged errors and their context, formatted when the log is read"""
+        if self._pending_logs:
+            for char, pos, context in self._pending_logs:
+                self._logger.append({
+                    "error": f"Invalid character '{char}' at position {pos}",
+                    "context": context
+                })
+            self._pending_logs.clear()
+        return self._logger
         
     @staticmethod
-    def batch_process(json_strings: List[str], max_workers: Optional[int] = None) -> List[JsonResults]:
-        """Static method for batch processing JSON strings"""
+    def batch_process(json_strings: List[str], max_workers: Optional[int] = None,
+                      use_processes: bool = False) -> List[JsonResults]:
+        """
+        Static method for batch processing JSON strings.
+
+        Strings are processed on a thread pool by default, which costs nothing to start and
+        passes inputs and results without pickling. Parsing itself holds the GIL, so threads
+        mostly pay off for batches of small or already-valid documents; once the Python
+        repair parser dominates (large, badly malformed inputs) use_processes=True spreads
+        the work over a process pool instead.
+
+        Args:
+            json_strings (List[str]): The JSON strings to process.
+            max_workers (int, optional): Number of workers. Defaults to cpu_count() - 1.
+            use_processes (bool, optional): Use a process pool instead of threads. Defaults to False.
+
+        Returns:
+            List[JsonResults]: One result per input string, in input order.
+        """
         workers = max_workers or max(1, cpu_count() - 1)
-        with Pool(processes=workers) as pool:
-            results = pool.map(_parallel_process, json_strings)
-        return results
-
-    @lru_cache(maxsize=1024)
-    def _cached_parse(self, json_str: str) -> Union[Dict, List, str, int, float, bool, None]:
-        """Cached version of parse for repeated JSON patterns"""
-        self.json_str = json_str
-        self.index = 0
-        return self.parse()
+        if use_processes:
+            return _pool_map(_parallel_process, json_strings, workers)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(_parallel_process, json_strings))
 
-    def _batch_process(self, json_strings: List[str]) -> List[JsonResults]:
-        """Process multiple JSON strings in parallel"""
-        with Pool(processes=self.max_workers) as pool:
-            results = pool.map(self.load_json, json_strings)
-        return results
+    def _batch_process(self, json_strings: List[str], use_processes: bool = False) -> List[JsonResults]:
+        """Process multiple JSON strings in parallel, see batch_process"""
+        return self.batch_process(json_strings, self.max_workers, use_processes)
 
     @staticmethod
-    @lru_cache(maxsize=128)
-    def _standardize_json(obj_str: str) -> str:
-        """Cached version of JSON standardization"""
+    def _standardize_json(obj_str: Union[str, Dict, List, int, float, bool, None]) -> str:
+        """
+        Standardizes JSON output format by removing unnecessary whitespace.
+
+        Args:
+            obj_str: A parsed JSON value, or a JSON string to parse first
+
+        Returns:
+            str: Compact JSON string, or obj_str unchanged if it can't be parsed/encoded
+        """
         try:
             if isinstance(obj_str, str):
                 try:
-                    obj = json.loads(obj_str)
+                    obj = _loads(obj_str)
                 except json.JSONDecodeError:
                     return obj_str
             else:
                 obj = obj_str
-            return json.dumps(obj, separators=(',', ':'))
+            return _dumps(obj)
         except (json.JSONDecodeError, TypeError):
             return obj_str
 
-    def __has_array_before_object(self, text: str) -> bool:
-        return text.count('[') > text.count('{')
-
-    def __has_minimum_one_brace(self, text: str) -> bool:
-        return text.count('{') >= 1 and text.count('}') >= 1
-
     def _is_special_value(self, value: str) -> Any:
         """Check if string is a special JSON value (number, bool, null)"""
-        value = value.strip().lower()
-        if value == 'true':
-            return True
-        if value == 'false':
-            return False
-        if value == 'null':
-            return None
+        value = value.strip()
+        if value in _KEYWORDS:
+            return _KEYWORDS[value]
+        first = value[:1]
+        if first not in _NUMBER_PREFIX:
+            return _KEYWORDS.get(value.lower()) if first.isalpha() else None
         try:
             return int(value) if value.isdigit() else float(value)
         except ValueError:
             return None
 
-    def _standardize_json(self, obj: Union[Dict, List, str, int, float, bool, None]) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def compile_schema(keys: Tuple[str, ...]) -> Callable[[str], Dict]:
         """
-        Standardizes JSON output format by removing unnecessary whitespace.
-        
+        Build a parser specialized for documents with a known set of keys.
+
+        Valid documents are decoded with _loads and the keys picked from the result. For
+        malformed ones the generated function finds each top-level key and decodes only the
+        value that follows it, skipping the general parse. Keys missing from a document are
+        left out of the result. Only quoted keys are found in malformed input, so use
+        load_json for input that may have bare keys. Parsers are cached per keys tuple.
+
         Args:
-            obj: The parsed JSON object
-            
+            keys (Tuple[str, ...]): The keys to extract.
+
         Returns:
-            str: Compact JSON string without extra whitespace
+            Callable[[str], Dict]: A function taking a JSON string and returning a dict of those keys.
+
+        Example:
+            >>> parse = JsonFixer.compile_schema(('direction', 'speed'))
+            >>> parse('{"direction": left, "speed": 50}')
+            {'direction': 'left', 'speed': 50}
         """
-        
-        return json.dumps(obj, separators=(',', ':'))
+        lines = [
+            'def parse_schema(s):',
+            '    try:',
+            '        doc = _loads(s)',
+            '    except JSONDecodeError:',
+            '        doc = None',
+            '    d = {}',
+            '    if isinstance(doc, dict):',
+        ]
+        for key in keys:
+            lines += [
+                f'        if {key!r} in doc:',
+                f'            d[{key!r}] = doc[{key!r}]',
+            ]
+        lines += ['        return d', '    src = _SchemaSource(s)']
+        for key in keys:
+            needle = json.dumps(key, ensure_ascii=False)
+            lines += [
+                f'    v = src.get({needle!r})',
+                '    if v is not _MISSING:',
+                f'        d[{key!r}] = v',
+            ]
+        lines.append('    return d')
 
+        namespace = {
+            '_loads': _loads,
+            'JSONDecodeError': json.JSONDecodeError,
+            '_SchemaSource': _SchemaSource,
+            '_MISSING': _MISSING,
+        }
+        exec(compile('\n'.join(lines), f'<schema {keys!r}>', 'exec'), namespace)
+        return namespace['parse_schema']
 
     def _track_error(self, char: str, pos: int):
         """
@@ -164,26 +673,27 @@ class JsonFixer:
 
         Side Effects:
             - Adds error to self.result if result object exists
-            - Appends error details to self.logger if logging is enabled
+            - Queues error details and context for self.logger if logging is enabled; the
+              message is only formatted once the logger is read
 
         Example:
             self._track_error('}', 10)  # Tracks unexpected closing brace at position 10
         """
-        if self.result:
-            self.result.add_error(char, pos)
-            if self.logging:
-                context_start = max(0, pos-10)
-                context_end = min(len(self.json_str), pos+10)
-                self.logger.append({
-                    "error": f"Invalid character '{char}' at position {pos}",
-                    "context": self.json_str[context_start:context_end] if pos >= 0 else "Unknown context"
-                })
+        if self.result is None:
+            return
+        self.result.add_error(char, pos)
+        if not self.logging:
+            return
+        # Slice the context now so queued entries don't keep the whole input alive
+        context = self.json_str[max(0, pos - 10):pos + 10] if pos >= 0 else "Unknown context"
+        self._pending_logs.append((char, pos, context))
 
     def parse(self) -> Union[Dict, List, str, int, float, bool, None]:
         """
         Parse the JSON string starting from the current index and return parsed value.
-        This method processes the JSON string character by character and delegates parsing
-        to specific methods based on the encountered character type:
+        Well-formed double-quoted strings, numbers and bare words are read whole with a single
+        compiled token regex. Anything else is delegated to the tolerant parsers based on the
+        encountered character type:
         - '{' -> parse_object() for dictionaries
         - '[' -> parse_array() for lists  
         - string delimiters or letters -> parse_string() for strings
@@ -197,53 +707,82 @@ class JsonFixer:
                 - bool for JSON booleans
                 - None for JSON null or if parsing fails
         """
-        while self.index < len(self.json_str):
-            char = self.json_str[self.index]
-            
-            if char.isspace():
-                self.index += 1
-                continue
+        s = self.json_str
+        n = len(s)
+        i = self.index
+        delimiters = self._DELIMITER_SET
+        
+        while i < n:
+            m = _TOKEN_RE.match(s, i)
+            if m is not None:
+                kind = m.lastindex
+                token = m.group(kind)
+                self.index = m.end()
+                if kind == _TOKEN_OPEN:
+                    return self.parse_object() if token == '{' else self.parse_array()
+                if kind == _TOKEN_STRING:
+                    return self._string_token(token)
+                if kind == _TOKEN_NUMBER:
+                    return float(token) if '.' in token or 'e' in token or 'E' in token else int(token)
+                return token
+
+            # Not a well-formed token, fall back to the tolerant parsers
+            i = _WS_RE.match(s, i).end()
+            if i >= n:
+                break
+            char = s[i]
                 
             if char == '{':
-                self.index += 1
+                self.index = i + 1
                 return self.parse_object()
             elif char == '[':
-                self.index += 1
+                self.index = i + 1
                 return self.parse_array()
-            elif char in self.STRING_DELIMITERS or char.isalpha():
+            elif char in delimiters or char.isalpha():
+                self.index = i
                 return self.parse_string()
             elif char.isdigit() or char in '.-':
+                self.index = i
                 return self.parse_number()
             
-            self.index += 1
+            i += 1
         
+        self.index = i
         return None
 
     def parse_object(self) -> Dict:
         obj = {}
+        setitem = obj.__setitem__
+        s = self.json_str
+        n = len(s)
         expect_key = True
         current_key = None
         
-        while self.index < len(self.json_str):
-            char = self.json_str[self.index]
-            
-            if char.isspace() or char == ',':
-                self.index += 1
-                continue
+        # self.index is re-read on every pass since the nested parse calls advance it
+        while self.index < n:
+            i = _WS_COMMA_RE.match(s, self.index).end()
+            if i >= n:
+                self.index = i
+                break
+            char = s[i]
                 
             if char == '}':
-                self.index += 1
+                self.index = i + 1
                 break
                 
+            self.index = i
             if expect_key:
                 current_key = self._cleanup_string(self.parse_string(), is_key=True)
+                if isinstance(current_key, str):
+                    # Keys repeat across documents, share one str object per distinct key
+                    current_key = _intern(current_key)
                 expect_key = False
             elif char == ':':
-                self.index += 1
+                self.index = i + 1
             else:
                 value = self.parse()
                 if current_key is not None and value is not None:
-                    obj[current_key] = value
+                    setitem(current_key, value)
                 current_key = None
                 expect_key = True
                 
@@ -258,21 +797,23 @@ class JsonFixer:
             List: The parsed array containing JSON elements (can be nested objects, arrays, or primitive values)
         """
         arr = []
+        append = arr.append
+        s = self.json_str
+        n = len(s)
         
-        while self.index < len(self.json_str):
-            while self.index < len(self.json_str) and self.json_str[self.index].isspace():
-                self.index += 1
+        while self.index < n:
+            i = _WS_RE.match(s, self.index).end()
                 
-            if self.index >= len(self.json_str) or self.json_str[self.index] == ']':
-                self.index += 1
+            if i >= n or s[i] == ']':
+                self.index = i + 1
                 break
                 
+            self.index = i
             value = self.parse()
             if value is not None:
-                arr.append(value)
+                append(value)
                 
-            while self.index < len(self.json_str) and (self.json_str[self.index].isspace() or self.json_str[self.index] == ','):
-                self.index += 1
+            self.index = _WS_COMMA_RE.match(s, self.index).end()
                 
         return arr
 
@@ -296,15 +837,17 @@ class JsonFixer:
             return s
         
        
-        result = ''
+        parts = []
+        append = parts.append
+        quotes = frozenset('"\'')
         prev_char = ''
         for char in s:
-            if char in ['"', "'"] and prev_char == char:
+            if char in quotes and prev_char == char:
                 continue
-            result += char
+            append(char)
             prev_char = char
         
-        print(result)
+        result = ''.join(parts)
         self.result.fixed = result
 
     def _cleanup_string(self, s: str, is_key: bool = False) -> str:
@@ -320,6 +863,12 @@ class JsonFixer:
             
         return result
 
+    def _string_token(self, content: str) -> str:
+        """Clean up the content of a complete double-quoted string the way parse_string does"""
+        if '\\' in content:
+            content = _ESCAPE_RE.sub(r'\1', content)
+        return self._cleanup_string(content.strip())
+
     def parse_string(self) -> str:
         """
         Parse and extract a string or number value from the JSON string starting at the current index.
@@ -342,57 +891,74 @@ class JsonFixer:
             12.34 -> 12.34
         """
         
-        if self.index >= len(self.json_str):
+        s = self.json_str
+        n = len(s)
+        i = self.index
+        if i >= n:
             return ""
             
-        start_pos = self.index
-        is_quoted = self.json_str[self.index] in self.STRING_DELIMITERS
+        if s[i] == '"':
+            m = _DQ_STRING_RE.match(s, i)
+            if m is not None:
+                self.index = m.end()
+                return self._string_token(m.group(1))
+
+        start_pos = i
+        is_quoted = s[i] in self._DELIMITER_SET
+        found_end = False
         
         if is_quoted:
-            quote = self.json_str[self.index]
-            self.index += 1
-            found_end = False
+            quote = s[i]
+            i += 1
         else:
             quote = None
             
-        string = ''
-        escaped = False
+        parts = []
+        append = parts.append
+        has_text = False  # Whether a non-whitespace char was read, ends unquoted values
+        run = (_QUOTED_RUN_RE[quote] if is_quoted else _UNQUOTED_RUN_RE).match
         
-        while self.index < len(self.json_str):
-            char = self.json_str[self.index]
+        while i < n:
+            # Consume everything up to the next backslash, quote or delimiter at once
+            end = run(s, i).end()
+            if end > i:
+                append(s[i:end])
+                has_text = True
+            i = end
+            if i >= n:
+                break
+            char = s[i]
             
-            if escaped:
-                escaped = False
-                string += char
-                self.index += 1
-                continue
-                
             if char == '\\':
-                escaped = True
-                self.index += 1
+                escaped = s[i + 1:i + 2]
+                append(escaped)
+                has_text = has_text or escaped not in _WHITESPACE
+                i += 2
                 continue
                 
-            if is_quoted and char == quote:
+            if is_quoted:
                 found_end = True
-                self.index += 1
+                i += 1
                 break
                 
-            if not is_quoted:
-                if char in ',:]}':
-                    break
-                if char.isspace() and string.strip():
-                    break
+            if char in ',:]}':
+                break
+            if has_text:
+                break
                     
-            string += char
-            self.index += 1
+            append(char)
+            i += 1
+        
+        self.index = i
         
         # Track unmatched quotes
         if is_quoted and not found_end:
             self._track_error(quote, start_pos)
             
-        result = string.strip()
+        result = ''.join(parts).strip()
         
-        if not is_quoted:
+        first = result[:1]
+        if not is_quoted and (first in _NUMBER_PREFIX or (first > '\x7f' and first.isdigit())):
             try:
                 if '.' in result:
                     return float(result)
@@ -415,24 +981,29 @@ class JsonFixer:
             >>> parse_number()
             123.45
         """
-        number = ''
-        while self.index < len(self.json_str) and (self.json_str[self.index].isdigit() or self.json_str[self.index] in '.-eE'):
-            number += self.json_str[self.index]
-            self.index += 1
+        i = self.index
+        end = _NUMBER_RE.match(self.json_str, i).end()
+        if end == i:
+            # parse() also dispatches non-decimal digits (e.g. '²') that \d doesn't match,
+            # consume that char so the caller always moves forward
+            end = i + 1
+        number = self.json_str[i:end]
+        self.index = end
             
         try:
             return int(number) if '.' not in number and 'e' not in number.lower() else float(number)
         except ValueError:
             return 0
 
-    def load_json(self, text: str) -> JsonResults:
+    def load_json(self, text: Union[str, bytes, bytearray, memoryview, mmap.mmap]) -> JsonResults:
         """
         Attempts to load and parse a JSON string, handling both valid JSON and malformed JSON cases.
         This method first attempts to identify valid JSON boundaries in the input text and then
         tries to parse it. If standard parsing fails, it employs a custom parsing strategy.
         Args:
-            text (str): The input text containing JSON data, which may be malformed or contain
-                       surrounding non-JSON content.
+            text (str | bytes-like): The input text containing JSON data, which may be malformed or
+                       contain surrounding non-JSON content. Buffers such as bytes or a memory-mapped
+                       file are decoded as UTF-8 directly from their memory.
         Returns:
             JsonResults: An object containing the original text, rough parsed text, and the
                         final fixed JSON string.
@@ -444,118 +1015,102 @@ class JsonFixer:
             >>> print(result.fixed)
             {"key": "value"}
         """
-        if len(text) > 10000:  # Process large inputs in parallel chunks
-            chunks = self._split_into_chunks(text)
-            with Pool(processes=self.max_workers) as pool:
-                parsed_chunks = pool.map(_process_json_chunk, chunks)
-            
-            # Merge parsed chunks
-            merged = {}
-            for chunk in parsed_chunks:
-                merged.update(chunk)
-                
-            result = JsonResults(text, json.dumps(merged, separators=(',', ':')))
-            return result
-            
+        if not isinstance(text, str):
+            text = str(text, 'utf-8')
         return self._process_chunk(text)
 
-    def _split_into_chunks(self, text: str, chunk_size: int = 5000) -> List[str]:
+    def iter_ndjson(self, text: Union[str, bytes, bytearray, memoryview, mmap.mmap]) -> Iterator[JsonResults]:
         """
-        Split a text string into chunks of specified size.
-        This method divides a given text into smaller chunks, where each chunk has
-        a maximum length specified by chunk_size. The last chunk might be smaller
-        than chunk_size if the text length is not perfectly divisible by chunk_size.
+        Lazily load and fix newline-delimited JSON (NDJSON), one document per line.
+        Lines are only ever split on newlines, never inside a document; blank lines are skipped.
         Args:
-            text (str): The input text string to be split into chunks.
-            chunk_size (int, optional): The maximum size of each chunk. Defaults to 5000.
-        Returns:
-            List[str]: A list of text chunks, where each chunk has a maximum length
-                      of chunk_size characters.
+            text (str | bytes-like): NDJSON text, decoded as UTF-8 if given as a buffer.
+        Yields:
+            JsonResults: The result for each non-blank line, in order.
         Example:
-            >>> text = "Hello World!"
-            >>> _split_into_chunks(text, 5)
-            ['Hello', ' Worl', 'd!']
+            >>> fixer = JsonFixer()
+            >>> [r.fixed for r in fixer.iter_ndjson('{"a": 1}\n{b: 2,}')]
+            ['{"a":1}', '{"b":2}']
         """
-        
-        return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+        if not isinstance(text, str):
+            text = str(text, 'utf-8')
+        # Only '\n' separates documents; splitlines() would also split on chars like U+2028
+        # that may appear raw inside JSON strings. Lines are cut one at a time with find so
+        # only the current one is held next to the text.
+        start = 0
+        n = len(text)
+        while start < n:
+            end = text.find('\n', start)
+            if end == -1:
+                end = n
+            line = text[start:end]
+            start = end + 1
+            if line.endswith('\r'):
+                line = line[:-1]
+            if line.strip():
+                yield self._process_chunk(line)
+
+    def _fast_path(self, text: str, original: Optional[str] = None) -> bool:
+        """
+        Try the C parser (orjson when available) before any custom repair work.
+
+        Well-formed JSON never needs the character-by-character walk, so it is handed
+        straight to the fast parser and only malformed input falls through to the fixer.
+        Input that is already compact is kept as is instead of being re-serialized.
+
+        Args:
+            text (str): The text to parse.
+            original (str, optional): The text to record as the original. Defaults to text.
+
+        Returns:
+            bool: True if the text parsed and self.result now holds the standardized JSON.
+        """
+        try:
+            parsed = _loads(text)
+        except json.JSONDecodeError:
+            return False
+        fixed = text if _is_compact(text, parsed) else _dumps(parsed)
+        self.result = JsonResults(text if original is None else original, fixed)
+        return True
 
     def _process_chunk(self, chunk: str) -> JsonResults:
         """Process a chunk of text to extract and validate JSON content."""
         original = chunk
         rough = chunk.strip()
         
+        if self._fast_path(rough, original):
+            return self.result
+
         self.result = JsonResults(original, rough)
+        self.json_str = rough  # Logged context is sliced from the text positions refer to
         
-        quote_stack = []  # [(quote_char, position)]
-        bracket_stack = []  # [(bracket_char, position)]
-        key_mode = True  # True when expecting a key in an object
-        
-        for i, char in enumerate(rough):
-            # Quote handling
-            if char in self.STRING_DELIMITERS:
-                if not quote_stack:
-                    quote_stack.append((char, i))
-                else:
-                    last_quote, last_pos = quote_stack[-1]
-                    if char == last_quote:
-                        quote_stack.pop()
-                    else:
-
-                        self._track_error(char, i)
-                        self._track_error(last_quote, last_pos)
-                continue
-                
-
-            if quote_stack:
-                continue
-                
-
-            if char in '[{':
-                bracket_stack.append((char, i))
-                if char == '{':
-                    key_mode = True
-            elif char in ']}':
-                if not bracket_stack:
-                    self._track_error(char, i)
-                else:
-                    open_char, open_pos = bracket_stack.pop()
-                    expected = ']' if open_char == '[' else '}'
-                    if char != expected:
-                        self._track_error(char, i)
-                        self._track_error(open_char, open_pos)
-            elif char == ':':
-                if not key_mode:
-                    self._track_error(char, i)
-                key_mode = False
-            elif char == ',':
-                key_mode = True
-                
-
-        for quote_char, pos in quote_stack:
-            self._track_error(quote_char, pos)
-
-            self._track_error(quote_char, len(rough))
-
-
-        for char, pos in bracket_stack:
+        for char, pos in _scan_errors(rough):
             self._track_error(char, pos)
 
-            expected = ']' if char == '[' else '}'
-            self._track_error(expected, len(rough))
-
-
         try:
-            if self.__has_array_before_object(rough):
-                rough = rough[rough.find('['):rough.rfind(']') + 1]
-            elif self.__has_minimum_one_brace(rough):
-                rough = rough[rough.find('{'):rough.rfind('}') + 1]
+            # find/rfind stop at the first hit, so this never scans the whole text twice
+            first_brace = rough.find('{')
+            first_bracket = rough.find('[')
+            if first_bracket != -1 and (first_brace == -1 or first_bracket < first_brace):
+                # A truncated array (no ']' after the '[') keeps everything from the '[' on
+                last_bracket = rough.rfind(']')
+                rough = rough[first_bracket:last_bracket + 1 if last_bracket > first_bracket else None]
+            elif first_brace != -1:
+                last_brace = rough.rfind('}')
+                if last_brace > first_brace:
+                    rough = rough[first_brace:last_brace + 1]
 
+            self.json_str = rough
             parsed = json.loads(rough)
-            self.result.fixed = self._standardize_json(parsed)
+            # Already-minified JSON is its own standard form, skip the re-serialization
+            self.result.fixed = rough if _is_compact(rough, parsed) else _dumps(parsed)
         except json.JSONDecodeError as e:
-            self._track_error(rough[e.pos], e.pos)
+            # pos is len(rough) when the input ends early, the slice gives '' there
+            self._track_error(rough[e.pos:e.pos + 1], e.pos)
             try:
-                parsed = self._cached_parse(rough)
+                parsed, parse_errors = _parse_cached(rough)
+                for char, pos in parse_errors:
+                    self._track_error(char, pos)
                 if isinstance(parsed, (list, dict)):
                     self.result.fixed = self._standardize_json(parsed)
                 else:
@@ -567,36 +1122,14 @@ class JsonFixer:
 
         return self.result
 
-    @staticmethod
-    def _merge_results(results: List[JsonResults]) -> JsonResults:
-        """Merge multiple JsonResults into one.
-
-        Args:
-            results (List[JsonResults]): A list of JsonResults objects to merge.
-
-        Returns:
-            JsonResults: A new JsonResults object containing:
-                - Combined 'fixed' strings from all input results concatenated
-                - Union of all 'errors' from input results
-
-        Example:
-            >>> results = [JsonResults("a", "1"), JsonResults("b", "2")]
-            >>> merged = _merge_results(results)
-            >>> merged.fixed == "ab"
-            True
-        """
-        merged = JsonResults("", "")
-        merged.fixed = "".join(r.fixed for r in results)
-        for r in results:
-            merged.errors.update(r.errors)
-        return merged
-
     @staticmethod
     def from_file(filename: str, logging: bool = False, max_size_mb: int = 10) -> JsonResults:
         """
         Reads a JSON file and attempts to fix any formatting issues.
 
-        Used primarily for testing purposes to load and validate JSON files.
+        Used primarily for testing purposes to load and validate JSON files. The file is
+        memory-mapped and decoded as UTF-8 straight from the mapping, without first reading
+        it into an intermediate buffer.
 
         Args:
             filename (str): Path to the JSON file to read
@@ -620,12 +1153,12 @@ class JsonFixer:
         if file_size > max_size_mb:
             raise ValueError(f"File size ({file_size:.1f}MB) exceeds maximum allowed size ({max_size_mb}MB)")
 
-        with open(filename, 'r') as f:
-            content = f.read()
-            if not content:
-                raise ValueError("File is empty")
+        if not os.path.getsize(filename):
+            raise ValueError("File is empty")
+
+        with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
             fixer = JsonFixer(logging=logging)
-            return fixer.load_json(content)
+            return fixer.load_json(mm)
     
     @staticmethod
     def _save_failure(failed: str):
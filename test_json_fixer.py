@@ -1,5 +1,8 @@
+import sys
+
 import pytest
 
+import jason_fixer
 from jason_fixer import JsonFixer, JsonResults
 
 @pytest.fixture
@@ -52,7 +55,11 @@ def test_array_parsing(json_fixer):
         ('[1,2,3]', '[1,2,3]'),
         ('[test, 2, three]', '["test",2,"three"]'),
         ('[[1,2],[3,4]]', '[[1,2],[3,4]]'),
-        ('[1, 2, 3]', '[1,2,3]')  # Handle spaces
+        ('[1, 2, 3]', '[1,2,3]'),  # Handle spaces
+        ('[{a: 1}, {b: 2}]', '[{"a":1},{"b":2}]'),  # Objects inside an array
+        ('[{"a": 1}', '[{"a":1}]'),  # Truncated arrays of objects
+        ('[{a: 1}, {b: 2}', '[{"a":1},{"b":2}]'),
+        ('Text: [{"a": 1}, {"b": 2}', '[{"a":1},{"b":2}]')
     ]
     for input_json, expected in cases:
         result = json_fixer.load_json(input_json)
@@ -70,3 +77,138 @@ def test_number_parsing(json_fixer):
         assert result.fixed == expected
 
 
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_batch_process(use_processes):
+    jsons = ['{"key1": "value1"}', '{key2: "value2",}', '[1, 2, 3]']
+    results = JsonFixer.batch_process(jsons, max_workers=2, use_processes=use_processes)
+    assert [r.fixed for r in results] == ['{"key1":"value1"}', '{"key2":"value2"}', '[1,2,3]']
+
+def test_from_file(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"direction": "left", speed: 50,}', encoding="utf-8")
+    result = JsonFixer.from_file(str(path))
+    assert result.fixed == '{"direction":"left","speed":50}'
+
+    empty = tmp_path / "empty.json"
+    empty.write_text("")
+    with pytest.raises(ValueError):
+        JsonFixer.from_file(str(empty))
+
+def test_error_tracking(json_fixer):
+    result = json_fixer.load_json('{"a": [1, 2}}')
+    assert result.fixed == '{"a":[1,2]}'
+    assert result.get_errors() == {'}': [11, 11], '[': [6]}
+    assert result.errors == result.get_errors()
+
+    # Log entries are queued with their context and formatted when the logger is read
+    assert len(json_fixer._pending_logs) == 3
+    expected_log = [
+        {'error': "Invalid character '}' at position 11", 'context': '"a": [1, 2}}'},
+        {'error': "Invalid character '[' at position 6", 'context': '{"a": [1, 2}}'},
+        {'error': "Invalid character '}' at position 11", 'context': '"a": [1, 2}}'},
+    ]
+    assert json_fixer.logger == expected_log
+    assert json_fixer._pending_logs == []
+    assert json_fixer.logger == expected_log  # Reading again doesn't duplicate entries
+
+    # Later inputs append, with context from their own text
+    json_fixer.load_json('{"b": "x"')
+    assert json_fixer.logger[3] == {'error': "Invalid character '{' at position 0", 'context': '{"b": "x"'}
+
+    quiet = JsonFixer()
+    quiet.load_json('{"a": [1, 2}}')
+    assert quiet.logger is None
+    assert quiet._pending_logs == []
+
+def test_iter_ndjson(json_fixer):
+    text = '{"direction": "left"}\n\n{speed: 50,}\n[1, test]\n'
+    results = list(json_fixer.iter_ndjson(text))
+    assert [r.fixed for r in results] == ['{"direction":"left"}', '{"speed":50}', '[1,"test"]']
+
+def test_compile_schema():
+    parse = JsonFixer.compile_schema(('direction', 'speed'))
+    assert parse('{"direction": "left", "speed": 50, "extra": 1}') == {"direction": "left", "speed": 50}
+    assert parse('{"direction": left, "speed": 50,}') == {"direction": "left", "speed": 50}
+    assert parse('{"direction": "left"}') == {"direction": "left"}
+    # Nested keys don't shadow top-level ones, valid or not
+    assert parse('{"meta": {"speed": 0}, "speed": 50}') == {"speed": 50}
+    assert parse('{"meta": {"speed": 0}, "speed": 50, "direction": left}') == {"direction": "left", "speed": 50}
+    # Brackets in single-quoted strings don't change the depth, single-quoted keys are found
+    assert JsonFixer.compile_schema(('speed',))('{"note": \'a}b\', "speed": 5}') == {"speed": 5}
+    assert parse("{'direction': 'left', 'speed': 5,}") == {"direction": "left", "speed": 5}
+    # A repeated key keeps its last value, valid or not
+    assert parse('{"speed": 1, "speed": 2}') == {"speed": 2}
+    assert parse('{"speed": 1, "speed": 2,}') == {"speed": 2}
+    assert JsonFixer.compile_schema(('direction', 'speed')) is parse
+
+def test_non_decimal_digits(json_fixer):
+    # Superscript digits pass isdigit() but aren't numbers, they must not stall the parser
+    assert json_fixer.load_json('[²]').fixed == '[0]'
+    assert json_fixer.load_json('{"a": [1, ²]}').fixed == '{"a":[1,0]}'
+
+def test_number_signs(json_fixer):
+    # A '+' only belongs to a number as the exponent sign, anywhere else it ends the number
+    cases = [
+        ('[2+, 3]', '[2,3]'),
+        ('{"a": 1.5+}', '{"a":1.5}'),
+        ('[1e+5+, 2]', '[100000.0,2]'),
+    ]
+    for input_json, expected in cases:
+        assert json_fixer.load_json(input_json).fixed == expected
+
+def test_big_integers(json_fixer):
+    cases = [
+        ('{"n": 99999999999999999999999}', '{"n":99999999999999999999999}'),
+        ('{"n": 18446744073709551616}', '{"n":18446744073709551616}'),
+        ('[-9223372036854775809, 1]', '[-9223372036854775809,1]'),
+        # Long digit runs that aren't big integers, and 64-bit integers, stay as they are
+        ('{"id":"123456789012345678901234","ts":1700000000123456789}',
+         '{"id":"123456789012345678901234","ts":1700000000123456789}'),
+        ('[18446744073709551615, 1]', '[18446744073709551615,1]'),
+    ]
+    for input_json, expected in cases:
+        assert json_fixer.load_json(input_json).fixed == expected
+
+def test_standardized_output(json_fixer):
+    cases = [
+        ('"a b"', '"a b"'),  # Top-level strings stay JSON strings
+        ('"[1, 2]"', '"[1, 2]"'),
+        ('{"a":"\\u00e9"}', '{"a":"é"}'),  # Same encoding with and without whitespace
+        ('{"a": "\\u00e9"}', '{"a":"é"}'),
+    ]
+    for input_json, expected in cases:
+        assert json_fixer.load_json(input_json).fixed == expected
+
+    # Compact input gets the same output as the same value with whitespace around it
+    for compact in ('{"a":NaN}', '{"a":-Infinity}', '[1.50,1e5,-0]', 'Text: {"a":NaN}',
+                    '{"a":1,"a":2}', 'Text: [{"a":1},{"b":{"c":1,"c":2}}]'):
+        spaced = compact.replace(':', ': ').replace(',', ', ')
+        assert json_fixer.load_json(compact).fixed == json_fixer.load_json(spaced).fixed
+
+    # Non-finite values are kept the way json writes them, with or without orjson
+    for input_json, expected in (('{"a": NaN}', '{"a":NaN}'), ('[1e400]', '[Infinity]'),
+                                 ('{a: -1e400, b: x}', '{"a":-Infinity,"b":"x"}')):
+        assert json_fixer.load_json(input_json).fixed == expected
+
+    # Text around compact JSON is trimmed and the JSON kept as is
+    for noisy, expected in (('Text: {"a":1}', '{"a":1}'), ('Here: [1,"x",true] done', '[1,"x",true]')):
+        result = json_fixer.load_json(noisy)
+        assert result.fixed == expected
+        assert result.original == noisy
+
+def test_iter_ndjson_line_separators(json_fixer):
+    # U+2028, U+2029 and U+0085 are valid raw inside JSON strings, only newlines split documents
+    text = '{"a": "x\u2028y"}\r\n{"b": "z\u2029w\x85v"}\n'
+    results = list(json_fixer.iter_ndjson(text))
+    assert [r.to_dict() for r in results] == [{"a": "x\u2028y"}, {"b": "z\u2029w\x85v"}]
+
+def test_structure_scan_backends(json_fixer, monkeypatch):
+    # Small malformed input is scanned in plain Python without importing numba
+    json_fixer.load_json('{"a": [1, 2}')
+    assert sys.modules.get('numba') is None
+    text = '{"a": [1, }, \'b: ] "c' * 50
+    expected = jason_fixer._scan_errors(text)
+    # Above the threshold the compiled scan runs when numba is installed, with the same result
+    monkeypatch.setattr(jason_fixer, '_JIT_SCAN_THRESHOLD', 0)
+    assert jason_fixer._scan_errors(text) == expected